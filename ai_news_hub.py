@@ -1,232 +1,568 @@
 import os
 import asyncio
+import orjson
+import hashlib
+import re
+import sqlite3
+import time
 import aiohttp
 import math
-from newsapi import NewsApiClient
+import httpx
 import logging
-from openai import AsyncOpenAI
+from urllib.parse import urlsplit
+from openai import AsyncOpenAI, BadRequestError
 import gradio as gr
-import traceback
-from collections import OrderedDict
 
 NEWSAPI_KEY = "your-key"
 OPENAI_API_KEY = "your-key"
 
-# Configure detailed logging to debug some errors
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Log at INFO by default; set LOG_LEVEL=DEBUG to see cache activity and full stack traces
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), format='%(asctime)s - %(levelname)s - %(message)s')
+log = logging.getLogger(__name__)
 
 if any(key is None for key in [NEWSAPI_KEY, OPENAI_API_KEY]):
-    logging.error("API keys are missing. Please check your environment variables.")
+    log.error("API keys are missing. Please check your environment variables.")
+
+# Summarizing and translating headlines doesn't need the largest model; override with OPENAI_MODEL.
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+
+NEWSAPI_TOP_HEADLINES_URL = "https://newsapi.org/v2/top-headlines"
 
 # Start the AsyncOpenAI client using our OPENAI API key.
-client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+# A single client is shared so its connection pool keeps TLS connections alive between requests.
+client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=75),
+        timeout=httpx.Timeout(60.0, connect=10.0)
+    )
+)
+
+# Cap the number of concurrent OpenAI requests so bursts of users don't trigger 429 rate limits.
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+_openai_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+# Shared aiohttp session for NewsAPI. It is created on first use because
+# it has to be bound to the event loop Gradio runs our handlers on.
+_session = None
+
+def get_session():
+    """Return the shared aiohttp session, creating it if needed."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=75),
+            headers={"X-Api-Key": NEWSAPI_KEY}
+        )
+    return _session
 
 # Simple cache implementation
-class SimpleCache(OrderedDict):
-    def __init__(self, max_size=100):
-        super().__init__()
+class SimpleCache:
+    """
+    LRU cache of awaitable results backed by a plain dict (insertion ordered).
+
+    Each entry is a future, so concurrent callers missing on the same key share
+    a single in-flight create_func call instead of each running it. Entries older
+    than ttl seconds are treated as misses.
+    """
+    def __init__(self, max_size=100, ttl=None):
+        self._entries = {}
+        self._expires = {}
         self.max_size = max_size
-        logging.info(f"Cache initialized with max size: {self.max_size}")
+        self.ttl = ttl
+        log.info("Cache initialized with max size: %s", self.max_size)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def peek(self, key):
+        """Return the future cached for key (marking it most recently used), or None on a miss."""
+        future = self._entries.pop(key, None)
+        if future is None:
+            return None
+        if self.ttl is not None and time.monotonic() > self._expires[key]:
+            del self._expires[key]
+            log.debug("Cache entry expired for key: %s", key)
+            return None
+        # Re-insert the key to mark it as most recently used
+        self._entries[key] = future
+        log.debug("Cache hit for key: %s", key)
+        return future
 
     async def get(self, key, create_func):
-        if key in self:
-            self.move_to_end(key)
-            logging.info(f"Cache hit for key: {key}")
-        else:
-            logging.info(f"Cache miss for key: {key}. Creating new entry...")
-            self[key] = await create_func()
-            if len(self) > self.max_size:
-                removed_key, _ = self.popitem(last=False)
-                logging.warning(f"Cache full. Removed oldest entry: {removed_key}")
-
-        return self[key]
-
-# Create a cache instance
-summary_cache = SimpleCache(max_size=100)
-
-def fetch_global_headlines(category='general', page_size=15):
-    """Retrieve news headlines from NewsAPI."""
-    def get_articles(response):
-        return response.get('articles', [])
+        future = self.peek(key)
+        if future is not None:
+            return await future
+
+        log.debug("Cache miss for key: %s. Creating new entry...", key)
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = future
+        if self.ttl is not None:
+            self._expires[key] = time.monotonic() + self.ttl
+        if len(self._entries) > self.max_size:
+            removed_key = next(iter(self._entries))
+            del self._entries[removed_key]
+            self._expires.pop(removed_key, None)
+            log.debug("Cache full. Removed oldest entry: %s", removed_key)
+
+        try:
+            result = await create_func()
+        except asyncio.CancelledError:
+            self._discard(key, future)
+            future.cancel()
+            raise
+        except Exception as e:
+            # Failures are not cached; callers already waiting on this key get the same error
+            self._discard(key, future)
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved in case nobody else was waiting
+            raise
+
+        future.set_result(result)
+        return result
+
+    def _discard(self, key, future):
+        if self._entries.get(key) is future:
+            del self._entries[key]
+            self._expires.pop(key, None)
+
+class SummaryStore:
+    """
+    SQLite-backed store for generated summaries, so they survive restarts.
+    Entries older than ttl seconds are ignored and purged on the next write.
+    The blocking sqlite3 calls are run in a worker thread.
+    """
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "hash BLOB PRIMARY KEY, summary TEXT NOT NULL, translated_title TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        log.info("Summary store opened at: %s", self.path)
+
+    def _get_many(self, keys):
+        conn = sqlite3.connect(self.path)
+        try:
+            rows = conn.execute(
+                f"SELECT hash, summary, translated_title FROM summaries "
+                f"WHERE hash IN ({','.join('?' * len(keys))}) AND ts >= ?",
+                [*keys, int(time.time()) - self.ttl]
+            ).fetchall()
+        finally:
+            conn.close()
+        return {key: {"summary": summary, "translated_title": title} for key, summary, title in rows}
+
+    def _put_many(self, entries):
+        now = int(time.time())
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute("DELETE FROM summaries WHERE ts < ?", (now - self.ttl,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO summaries (hash, summary, translated_title, ts) VALUES (?, ?, ?, ?)",
+                [(key, entry["summary"], entry["translated_title"], now) for key, entry in entries.items()]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    async def get_many(self, keys):
+        """Return the stored entries for the given keys that exist on disk."""
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self._get_many, list(keys))
+
+    async def put_many(self, entries):
+        """Store a dict of entries keyed by cache key."""
+        if entries:
+            await asyncio.to_thread(self._put_many, entries)
+
+# Create a cache instance, backed by a persistent store on disk; both expire entries after the same TTL
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", str(24 * 60 * 60)))
+summary_cache = SimpleCache(max_size=100, ttl=SUMMARY_CACHE_TTL)
+summary_store = SummaryStore(
+    os.getenv("SUMMARY_CACHE_PATH", os.path.join(".cache", "summaries.sqlite3")),
+    ttl=SUMMARY_CACHE_TTL
+)
+
+# Summaries shorter than this are treated as missing
+MIN_SUMMARY_LENGTH = 50
+
+def is_complete_summary(entry, is_english):
+    """Check that a generated entry is worth caching: a real summary, plus a title if one was requested."""
+    return len(entry.get("summary", "")) >= MIN_SUMMARY_LENGTH and (is_english or bool(entry.get("translated_title")))
+
+def summary_cache_key(description, language, title=None):
+    """
+    Build a compact cache key from the (already truncated) article text and target language.
+    Pass the title when it is translated along with the summary, since it is then part of the cached entry.
+    """
+    key = hashlib.blake2b(description.encode("utf-8"), digest_size=16, key=language.encode("utf-8"))
+    if title is not None:
+        key.update(b"\0" + title.encode("utf-8"))
+    return key.digest()
 
+async def fetch_global_headlines(category='general', page_size=15):
+    """Retrieve news headlines from NewsAPI."""
     try:
-        top_headlines = NewsApiClient(api_key=NEWSAPI_KEY).get_top_headlines(
-            category=category,
-            language='en',
-            page_size=page_size
-        )
+        params = {"category": category, "language": "en", "pageSize": page_size}
+        async with get_session().get(NEWSAPI_TOP_HEADLINES_URL, params=params) as response:
+            response.raise_for_status()
+            top_headlines = orjson.loads(await response.read())
 
-        articles = get_articles(top_headlines)
-        logging.info(f"Response received from NewsAPI. {len(articles)} articles were retrieved.")
+        articles = top_headlines.get('articles', [])
+        log.info("Response received from NewsAPI. %d articles were retrieved.", len(articles))
         return articles
 
     except Exception as e:
-        logging.error(f"Error fetching headlines: {e}", exc_info=True)
+        log.error("Error fetching headlines: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
         return []
 
 async def send_warmup_request():
     """Send a minimal request to OpenAI to warm up the connection."""
-    return await client.chat.completions.create(
-        model="gpt-4",
-        messages=[{"role": "system", "content": "Warm-up request"}],
-        max_tokens=5
-    )
+    async with _openai_semaphore:
+        return await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[{"role": "system", "content": "Warm-up request"}],
+            max_tokens=5
+        )
+
+# The shared client keeps its connections alive, so one warm-up per process is enough.
+_openai_warmed_up = False
+# Keep references to background tasks so they aren't garbage collected before finishing
+_background_tasks = set()
 
 async def warm_up_openai():
-    """Warm up the OpenAI API connection by sending a test request."""
+    """Warm up the OpenAI API connection by sending a test request (once per process)."""
+    global _openai_warmed_up
+    if _openai_warmed_up:
+        return
+    _openai_warmed_up = True
     try:
         await send_warmup_request()
-        logging.info("OpenAI connection warmed up successfully.")
+        log.info("OpenAI connection warmed up successfully.")
     except Exception as e:
-        logging.error(f"Failed to warm up OpenAI connection: {e}")
-        logging.error(traceback.format_exc())
-
-async def translate_text(text: str, target_language: str) -> str:
-    """Translate the given text to the target language using GPT-4."""
+        _openai_warmed_up = False
+        log.error("Failed to warm up OpenAI connection: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+
+def start_warm_up_openai():
+    """Warm up the OpenAI connection in the background without delaying the caller."""
+    if _openai_warmed_up:
+        return
+    task = asyncio.create_task(warm_up_openai())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def extract_article(article, language, is_english):
+    """Extract the fields we need from a NewsAPI article."""
+    source = article.get('source', {}).get('name', '[Source Unavailable]')
+    title = article.get('title', '[Title Unavailable]')
+    # Only the first 1000 characters are ever used, so slice once here for both the cache key and the prompt
+    description = (article.get('description') or article.get('content') or title or "")[:1000]
+    return {
+        "source": source,
+        "title": title,
+        "description": description,
+        "url": article.get('url', '#'),
+        "image_url": article.get('urlToImage', ''),
+        "cache_key": summary_cache_key(description, language, None if is_english else title or ""),
+    }
+
+def has_sufficient_content(info):
+    """Check whether an article has enough text to be worth summarizing."""
+    return bool(info["title"] and info["description"] and len(info["description"]) >= 50)
+
+async def summarize_articles_batch(articles, language, is_english):
+    """Summarize several articles (and translate their titles) with a single OpenAI request.
+
+    Returns a dict mapping each article's cache key to its ``summary`` and ``translated_title``.
+    """
     system_prompt = (
-        f"You are a professional translator. Translate the following text to {target_language}."
+        "You are an expert news analyst and summarizer. Provide concise, insightful summaries that capture "
+        "the core of news articles, including key events, figures, and implications. "
+        "Always answer with valid JSON only."
     )
-    user_prompt = {"role": "user", "content": text}
-    
+
+    articles_json = orjson.dumps([
+        {"index": index, "title": info["title"], "article": info["description"]}
+        for index, info in enumerate(articles, start=1)
+    ]).decode()
+    # English needs no translation, so only ask for translated titles for other languages
+    if is_english:
+        language_instructions = ""
+        entry_format = '{"index": ..., "summary": ...}'
+    else:
+        language_instructions = f"Respond in {language} and translate each title to {language}. "
+        entry_format = '{"index": ..., "summary": ..., "translated_title": ...}'
+
+    user_prompt = (
+        f"Summarize each news article below in 2-3 sentences. Highlight the main event, key figures, and any "
+        f"significant impacts or outcomes. Ensure each summary is informative and contextual. "
+        f"{language_instructions}"
+        f'Return a JSON object {{"articles": [{entry_format}]}} '
+        f"for the following JSON array of {len(articles)} articles:\n{articles_json}"
+    )
+
+    # max_tokens is only a cap, but a reply cut off at the cap is invalid JSON and loses the whole
+    # batch, so leave room for the JSON wrapping of each entry and for translated output. Summaries
+    # in languages such as Hindi, Arabic or Chinese take more tokens, so they get a larger budget,
+    # like the separate translate call used to.
+    summary_tokens = 150 if is_english else 250
+    title_tokens = 0 if is_english else sum(2 * len(info["title"]) // 3 for info in articles)
+    max_tokens = min(8192, 20 + (summary_tokens + 25) * len(articles) + title_tokens)
+
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                user_prompt
-            ],
-            max_tokens=250,
-            temperature=0.3
-        )
-        return response.choices[0].message.content.strip()
+        async with _openai_semaphore:
+            response = await create_json_completion(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.5
+            )
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            log.error("Summary reply for %d articles was truncated at max_tokens=%d.", len(articles), max_tokens)
+            return {}
+        entries = parse_summary_entries(choice.message.content)
+
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            position = int(entry.get("index", 0)) - 1
+            if 0 <= position < len(articles):
+                results[articles[position]["cache_key"]] = {
+                    "summary": str(entry.get("summary", "")).strip(),
+                    "translated_title": str(entry.get("translated_title", "")).strip(),
+                }
+        return results
+
     except Exception as e:
-        logging.error(f"Error translating text: {str(e)}")
-        return text
+        log.error("Error summarizing articles: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        return {}
 
-async def process_article(article, language):
-    """Process a single article: extract info, generate summary, and translate title if needed."""
-    try:
-        # Extract article metadata
-        source = article.get('source', {}).get('name', '[Source Unavailable]')
-        title = article.get('title', '[Title Unavailable]')
-        description = article.get('description') or article.get('content') or title
-        url = article.get('url', '#')
-        image_url = article.get('urlToImage', '')
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
 
+def parse_summary_entries(content):
+    """
+    Parse the model's reply into a list of summary entries.
+    Without JSON mode, models often wrap the JSON in code fences or surrounding text, or
+    return a bare array instead of {"articles": [...]}, so all of those are accepted.
+    """
+    content = (content or "").strip()
+    fenced = _CODE_FENCE.search(content)
+    if fenced:
+        content = fenced.group(1)
+    # Drop any text around the outermost JSON object or array
+    starts = [i for i in (content.find("{"), content.find("[")) if i != -1]
+    if starts:
+        start = min(starts)
+        end = content.rfind("}" if content[start] == "{" else "]")
+        content = content[start:end + 1]
+
+    data = orjson.loads(content)
+    if isinstance(data, dict):
+        data = data.get("articles", [])
+    return data if isinstance(data, list) else []
+
+# Cleared once the configured model rejects JSON mode (e.g. gpt-4), so we stop asking for it
+_json_mode_supported = True
+
+async def create_json_completion(**kwargs):
+    """Request a chat completion in JSON mode, falling back to a plain request for models without it."""
+    global _json_mode_supported
+    if _json_mode_supported:
+        try:
+            return await client.chat.completions.create(response_format={"type": "json_object"}, **kwargs)
+        except BadRequestError as e:
+            if "response_format" not in str(e):
+                raise
+            _json_mode_supported = False
+            log.warning("Model %s does not support JSON mode; retrying without it.", kwargs.get("model"))
+    return await client.chat.completions.create(**kwargs)
+
+async def load_summaries(articles, language, is_english):
+    """Load summaries from the persistent store and summarize whatever is missing in one request."""
+    try:
+        results = await summary_store.get_many([info["cache_key"] for info in articles])
+    except Exception as e:
+        log.error("Error reading summary store: %s", e)
+        results = {}
+
+    missing = [info for info in articles if info["cache_key"] not in results]
+    if missing:
+        summarized = await summarize_articles_batch(missing, language, is_english)
+        results.update(summarized)
+        try:
+            # Only persist complete entries, so a bad reply is retried on the next request instead of stored
+            await summary_store.put_many({
+                key: entry for key, entry in summarized.items() if is_complete_summary(entry, is_english)
+            })
+        except Exception as e:
+            log.error("Error writing summary store: %s", e)
+
+    log.info("%d summaries loaded from disk, %d requested from OpenAI", len(articles) - len(missing), len(missing))
+    return results
+
+async def summary_from_batch(batch, cache_key, is_english):
+    """
+    Wait for the batched summary request and pick out the result for one article.
+    Raises KeyError for missing or incomplete entries, so the summary cache doesn't keep them.
+    """
+    if batch is None:
+        raise KeyError(cache_key)
+    entry = (await batch)[cache_key]
+    if not is_complete_summary(entry, is_english):
+        raise KeyError(cache_key)
+    return entry
+
+async def process_article(info, is_english, batch, cached=None):
+    """
+    Render a single article card once its summary is available.
+    cached is the summary cache's future for this article, if it was a hit when the request started.
+    """
+    title = info["title"]
+    url = info["url"]
+    try:
         # Check for sufficient content
-        if not title or not description or len(description) < 50:
-            logging.warning(f"Skipping article due to insufficient content: {title}")
+        if not has_sufficient_content(info):
+            log.warning("Skipping article due to insufficient content: %s", title)
             return generate_html_card(
                 title=title,
                 url=url,
-                source=source,
+                source=info["source"],
                 summary="Content unavailable for this article.",
                 image_url=None
             )
 
-        # Generate a cache key and get or generate the summary
-        cache_key = f"{description[:1000]}_{language}"
-        summary = await summary_cache.get(cache_key, lambda: summarize_article(description, language))
-
-        if len(summary) < 50:
+        # Get the summary from the cache, or from the batched request on a miss
+        try:
+            if cached is not None:
+                result = await cached
+            else:
+                result = await summary_cache.get(
+                    info["cache_key"], lambda: summary_from_batch(batch, info["cache_key"], is_english)
+                )
+        except KeyError:
+            log.warning("No summary returned for article: %s", title)
+            result = {}
+
+        summary = result.get("summary", "")
+        if len(summary) < MIN_SUMMARY_LENGTH:
             summary = f"Summary unavailable. Please read the full article at: {url}"
 
-        # Translate title if necessary
-        if language.lower() != "english":
-            title = await translate_text(title, language)
+        # Use the translated title if necessary
+        if not is_english:
+            title = result.get("translated_title") or title
 
         return generate_html_card(
             title=title,
             url=url,
-            source=source,
+            source=info["source"],
             summary=summary,
-            image_url=image_url
+            image_url=info["image_url"]
         )
 
     except Exception as e:
-        logging.error(f"Error processing article: {str(e)}")
-        logging.error(traceback.format_exc())
-        return f"<div>Error processing article: {str(e)}</div>"
-
-async def summarize_article(article_text: str, language: str) -> str:
-    """Asynchronously summarize an article using OpenAI's GPT-4 model and translate if needed."""
-    system_prompt = (
-        "You are an expert news analyst and summarizer. Provide concise, insightful summaries that capture "
-        "the core of news articles, including key events, figures, and implications."
-    )
+        log.error("Error processing article: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        return error_card(e)
 
-    user_prompt = (
-        f"Summarize this news article in 2-3 sentences. Highlight the main event, key figures, and any "
-        f"significant impacts or outcomes. Ensure the summary is informative and contextual. "
-        f"Article: {article_text[:1000]}"
-    )
-
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=150,
-            temperature=0.5
-        )
-        summary = response.choices[0].message.content.strip()
-
-        if language.lower() != "english":
-            summary = await translate_text(summary, language)
-
-        return summary
-
-    except Exception as e:
-        logging.error(f"Error summarizing article: {str(e)}")
-        logging.error(traceback.format_exc())
-        return (
-            "Unable to generate summary due to an error. "
-            "Please refer to the original article for information."
-        )
+def error_card(error):
+    """Render the placeholder shown in place of an article that could not be processed."""
+    return f"<div>Error processing article: {escape_html(error)}</div>"
 
 async def news_aggregator_async(category, language):
-    """Main asynchronous function to aggregate and summarize news."""
+    """Main asynchronous generator to aggregate and summarize news, yielding the page as each card is ready."""
     try:
-        await warm_up_openai()
-
-        logging.info(f"Fetching headlines for category: {category}")
-        articles = fetch_global_headlines(category=category)
+        log.info("Fetching headlines for category: %s", category)
+        # Start the one-time OpenAI warm-up alongside the NewsAPI round-trip, for clients that call the
+        # API without loading the page first. It isn't awaited: the summary request opens its own connection.
+        start_warm_up_openai()
+        articles = await fetch_global_headlines(category=category)
         
         if not articles:
-            return "No news articles found for this category. Please try another category."
-
-        logging.info(f"We have got {len(articles)} articles. Now they are processing...")
-
-        summarized_articles = await asyncio.gather(*[process_article(article, language) for article in articles])
-
-        if not summarized_articles:
-            return "Error processing news articles. Please try again later."
-
-        logging.info(f"Successfully processed {len(summarized_articles)} articles")
-        return "".join(summarized_articles)
+            yield "No news articles found for this category. Please try another category."
+            return
+
+        log.info("We have got %d articles. Now they are processing...", len(articles))
+
+        is_english = language.strip().lower() == "english"
+        # Extract each article separately, so one malformed entry becomes an error card
+        # instead of failing the whole page
+        cards = [""] * len(articles)
+        infos = {}
+        for index, article in enumerate(articles):
+            try:
+                infos[index] = extract_article(article, language, is_english)
+            except Exception as e:
+                log.error("Error processing article: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+                cards[index] = error_card(e)
+
+        # Load every uncached summary from disk or a single OpenAI request, then render the cards.
+        # The cache key covers everything in the cached entry (description, language, and the title
+        # when it is translated), so articles sharing a key can safely share one summary request.
+        # For English, syndicated articles with the same description are summarized only once.
+        # Hits keep their cached futures, since this request's misses may evict them from the LRU
+        # before their cards are rendered.
+        pending = {}
+        cached = {}
+        for info in infos.values():
+            key = info["cache_key"]
+            if not has_sufficient_content(info) or key in pending or key in cached:
+                continue
+            future = summary_cache.peek(key)
+            if future is not None:
+                cached[key] = future
+            else:
+                pending[key] = info
+        batch = asyncio.ensure_future(load_summaries(list(pending.values()), language, is_english)) if pending else None
+
+        # Stream each card to the page as soon as it is rendered instead of waiting for the slowest one,
+        # keeping one slot per article so the page stays in NewsAPI's headline order
+        async def render(index, info):
+            return index, await process_article(info, is_english, batch, cached.get(info["cache_key"]))
+
+        # Show error cards right away (and still produce a page if every article failed to extract)
+        if len(infos) < len(articles):
+            yield "".join(cards)
+        for rendered in asyncio.as_completed([render(index, info) for index, info in infos.items()]):
+            index, card = await rendered
+            cards[index] = card
+            yield "".join(cards)
+
+        log.info("Successfully processed %d articles", len(articles))
     except Exception as e:
-        logging.error(f"Error in news_aggregator_async: {str(e)}")
-        logging.error(traceback.format_exc())
-        return "We are experiencing technical difficulties. Please try again later or choose a different category."
+        log.error("Error in news_aggregator_async: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        yield "We are experiencing technical difficulties. Please try again later or choose a different category."
 
-def news_aggregator(category, language):
+async def news_aggregator(category, language):
     if not category or not language:
-        return "Please select a news category and language."
+        yield "Please select a news category and language."
+        return
     try:
-        return asyncio.run(news_aggregator_async(category, language))
+        # Clear the previous results within the same event before the new cards stream in
+        yield ""
+        # Run directly on Gradio's event loop so the shared HTTP sessions stay usable
+        async for html in news_aggregator_async(category, language):
+            yield html
     except Exception as e:
-        logging.error(f"Error in news_aggregator: {str(e)}")
-        logging.error(traceback.format_exc())
-        return f"An error occurred: {str(e)}"
+        log.error("Error in news_aggregator: %s", e, exc_info=log.isEnabledFor(logging.DEBUG))
+        yield f"An error occurred: {escape_html(e)}"
 
-def generate_html_card(title, url, source, summary, image_url=None):
-    """
-    Generate an HTML card for the article.
-    """
-    image_html = f'<img src="{image_url}" alt="Article image" class="article-image">' if image_url else ''
-    return f"""
+# HTML templates for an article card, filled in by generate_html_card
+_CARD_TEMPLATE = """
     <div class='article-card'>
         <h3><a href='{url}' target='_blank'>{title}</a></h3>
         <p><strong>Media:</strong> {source}</p>
@@ -234,6 +570,41 @@ def generate_html_card(title, url, source, summary, image_url=None):
         {image_html}
     </div>
     """
+_IMAGE_TEMPLATE = '<img src="{image_url}" alt="Article image" class="article-image">'
+
+# Translation table for escaping text placed in HTML, applied in a single pass per string
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+def escape_html(value):
+    """Escape a value for safe use in HTML text and attributes."""
+    return str(value).translate(_HTML_ESCAPE)
+
+def safe_url(value):
+    """Return value if it is an absolute http(s) URL, otherwise None (rejects javascript:, data:, etc.)."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return None
+    if parts.scheme.lower() not in ("http", "https") or not parts.netloc:
+        return None
+    return value
+
+def generate_html_card(title, url, source, summary, image_url=None):
+    """
+    Generate an HTML card for the article.
+    """
+    url = safe_url(url) or "#"
+    image_url = safe_url(image_url)
+    return _CARD_TEMPLATE.format_map({
+        "url": escape_html(url),
+        "title": escape_html(title),
+        "source": escape_html(source),
+        "summary": escape_html(summary),
+        "image_html": _IMAGE_TEMPLATE.format(image_url=escape_html(image_url)) if image_url else ""
+    })
 
 # News Categories list
 CATEGORIES = [
@@ -378,8 +749,10 @@ with gr.Blocks(css=css, elem_id="gradio-container") as iface:
         with gr.Column(scale=2):
             output = gr.HTML(elem_id="output-container")
     
+    # Warm up the OpenAI connection when the page loads, off the request path
+    iface.load(fn=warm_up_openai, inputs=None, outputs=None)
+
     submit_button.click(fn=news_aggregator, inputs=[category_input, language_input], outputs=output)
-    
-    submit_button.click(fn=lambda: output.update(''), inputs=[], outputs=output)
 
-iface.launch()
\ No newline at end of file
+# Streaming outputs from generator handlers go through Gradio's queue
+iface.queue().launch()
\ No newline at end of file